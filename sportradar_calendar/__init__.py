@@ -14,6 +14,8 @@ def create_app():
     app.add_url_rule('/add', 'event.add',  event.routes.add_view, methods=['GET', 'POST'])
     app.add_url_rule('/', 'event', event.routes.get_all_view, methods=['GET'])
     app.add_url_rule('/delete/<id>', 'event.delete', event.routes.delete, methods=['DELETE'])
+    app.cli.add_command(event.sync.sync_feed_command)
+    app.cli.add_command(event.index.event_index_report_command)
 
     # Sport
     from . import sport
@@ -26,12 +28,16 @@ def create_app():
     app.add_url_rule('/team/add', 'team.add',  team.routes.add_view, methods=['GET', 'POST'])
     app.add_url_rule('/team', 'team', team.routes.get_all_view, methods=['GET'])
     app.add_url_rule('/team/delete/<id>', 'team.delete', team.routes.delete, methods=['DELETE'])
+    app.add_url_rule('/team/<int:id>/schedule', 'team.schedule', team.routes.schedule_view, methods=['GET'])
+    app.add_url_rule('/api/team/<int:id>/schedule', 'team.schedule_api', team.routes.schedule_api, methods=['GET'])
 
     # Venue
     from . import venue
     app.add_url_rule('/venue/add', 'venue.add',  venue.routes.add_view, methods=['GET', 'POST'])
     app.add_url_rule('/venue', 'venue', venue.routes.get_all_view, methods=['GET'])
     app.add_url_rule('/venue/delete/<id>', 'venue.delete', venue.routes.delete, methods=['DELETE'])
+    app.add_url_rule('/venue/<int:id>/schedule', 'venue.schedule', venue.routes.schedule_view, methods=['GET'])
+    app.add_url_rule('/api/venue/<int:id>/schedule', 'venue.schedule_api', venue.routes.schedule_api, methods=['GET'])
 
 
     return app
\ No newline at end of file
@@ -1,3 +1,4 @@
 DATABASE = 'database.db'
 SCHEMA = 'schema.sql'
-SECRET_KEY = 'dev'
\ No newline at end of file
+SECRET_KEY = 'dev'
+EVENT_INDEX = False
\ No newline at end of file
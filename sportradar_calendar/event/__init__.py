@@ -1 +1 @@
-from . import routes
+from . import routes, sync, index
\ No newline at end of file
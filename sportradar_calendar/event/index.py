@@ -0,0 +1,223 @@
+import statistics
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import lru_cache
+
+import click
+
+from ..db import get_db
+from .services import manager
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: str) -> int:
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        raise ValueError(f"Timezone-aware date {value!r} is not comparable to stored dates.")
+    return int((dt - EPOCH).total_seconds())
+
+
+# every query formats the dates of all rows it returns, so the same event
+# dates are formatted over and over; the strings are cached per epoch
+@lru_cache(maxsize=16384)
+def from_epoch(seconds: int) -> str:
+    fmt = "%Y-%m-%dT%H:%M:%S" if seconds % 60 else "%Y-%m-%dT%H:%M"
+    return time.strftime(fmt, time.gmtime(seconds))
+
+
+class EventColumns():
+    """
+    Immutable, array-backed copy of the event table for one change-counter
+    version. Rows are sorted by (sport, date, id) so every sport is a
+    contiguous slice; `date_order` lists the same rows sorted by (date, id).
+    Ties therefore come back in the order of SQLite's reverse index scans.
+    Rows whose date or ids cannot be read are left out and counted in `skipped`.
+    """
+
+    def __init__(self, db, version: int) -> None:
+        self.version = version
+        self.sport_names = {
+            r["sport_id"]: sys.intern(r["name"]) for r in db.execute("SELECT sport_id, name FROM sport")
+        }
+        self.team_names = {
+            r["team_id"]: sys.intern(r["name"]) for r in db.execute("SELECT team_id, name FROM team")
+        }
+        self.venue_names = {
+            r["venue_id"]: sys.intern(f"{r['name']} — {r['city']}")
+            for r in db.execute("SELECT venue_id, name, city FROM venue")
+        }
+
+        self.event_ids = array("q")
+        self.epochs = array("q")
+        # SQLite integers are 64-bit, so every stored id fits
+        self.sport_ids = array("q")
+        self.home_team_ids = array("q")
+        self.away_team_ids = array("q")
+        self.venue_ids = array("q")
+        self.descriptions = []
+        self.external_ids = []
+        self.sport_offsets = {}
+        self.skipped = 0
+
+        rows = db.execute(
+            "SELECT event_id, event_date, description, _sport_id, _home_team_id, "
+            "_away_team_id, _venue_id, external_id FROM event "
+            "ORDER BY _sport_id, event_date, event_id"
+        )
+        for row in rows:
+            try:
+                epoch = to_epoch(row["event_date"])
+            except (TypeError, ValueError):
+                epoch = None
+            ids = (row["_sport_id"], row["_home_team_id"], row["_away_team_id"], row["_venue_id"])
+            if epoch is None or not all(type(i) is int for i in ids):
+                self.skipped += 1
+                continue
+            sport_id, home_team_id, away_team_id, venue_id = ids
+            position = len(self.event_ids)
+            start, _ = self.sport_offsets.get(sport_id, (position, position))
+            self.sport_offsets[sport_id] = (start, position + 1)
+            self.event_ids.append(row["event_id"])
+            self.epochs.append(epoch)
+            self.sport_ids.append(sport_id)
+            self.home_team_ids.append(home_team_id)
+            self.away_team_ids.append(away_team_id)
+            self.venue_ids.append(venue_id)
+            self.descriptions.append(row["description"])
+            self.external_ids.append(row["external_id"])
+
+        self.date_order = array(
+            "i", sorted(range(len(self.epochs)), key=lambda i: (self.epochs[i], self.event_ids[i]))
+        )
+        self.date_epochs = array("q", (self.epochs[i] for i in self.date_order))
+
+    def __len__(self) -> int:
+        return len(self.event_ids)
+
+    def row(self, position: int) -> dict:
+        return {
+            "event_id": self.event_ids[position],
+            "event_date": from_epoch(self.epochs[position]),
+            "description": self.descriptions[position],
+            "_sport_id": self.sport_ids[position],
+            "_home_team_id": self.home_team_ids[position],
+            "_away_team_id": self.away_team_ids[position],
+            "_venue_id": self.venue_ids[position],
+            "external_id": self.external_ids[position],
+        }
+
+    def positions(self, sport_id=None, lower=None, upper=None):
+        """Row positions matching the filters, latest first."""
+        if sport_id:
+            start, end = self.sport_offsets.get(sport_id, (0, 0))
+            lo = bisect_left(self.epochs, lower, start, end) if lower is not None else start
+            hi = bisect_right(self.epochs, upper, start, end) if upper is not None else end
+            return range(hi - 1, lo - 1, -1)
+        lo = bisect_left(self.date_epochs, lower) if lower is not None else 0
+        hi = bisect_right(self.date_epochs, upper) if upper is not None else len(self)
+        return (self.date_order[i] for i in range(hi - 1, lo - 1, -1))
+
+    def memory_usage(self) -> int:
+        arrays = (
+            self.event_ids, self.epochs, self.sport_ids, self.home_team_ids,
+            self.away_team_ids, self.venue_ids, self.date_order, self.date_epochs,
+        )
+        size = sum(a.buffer_info()[1] * a.itemsize for a in arrays)
+        size += sys.getsizeof(self.descriptions) + sys.getsizeof(self.external_ids)
+        strings = {id(s): s for s in self.descriptions + self.external_ids if s is not None}
+        for names in (self.sport_names, self.team_names, self.venue_names):
+            strings.update((id(s), s) for s in names.values())
+        return size + sum(sys.getsizeof(s) for s in strings.values())
+
+
+class EventIndex():
+    """
+    Per-worker read engine answering `get_filtered` from `EventColumns`.
+    The snapshot is rebuilt whenever the database change counter moves.
+    """
+
+    def __init__(self) -> None:
+        self._columns = None
+        self._lock = threading.Lock()
+
+    def columns(self) -> EventColumns:
+        db = get_db()
+        version = db.execute("SELECT version FROM change_counter").fetchone()[0]
+        with self._lock:
+            if self._columns is None or self._columns.version != version:
+                self._columns = EventColumns(db, version)
+            return self._columns
+
+    def get_filtered(self, sport_id=None, date_from=None, date_to=None) -> list[dict]:
+        try:
+            lower = to_epoch(date_from) if date_from else None
+            if date_to:
+                upper = to_epoch(date_to if "T" in date_to else f"{date_to}T23:59")
+            else:
+                upper = None
+        except ValueError:
+            # leave inputs we cannot parse to SQLite's string comparison
+            return manager.get_filtered(sport_id=sport_id, date_from=date_from, date_to=date_to)
+
+        columns = self.columns()
+        if columns.skipped:
+            # the snapshot is missing rows, only SQLite can return all of them
+            return manager.get_filtered(sport_id=sport_id, date_from=date_from, date_to=date_to)
+        return [columns.row(p) for p in columns.positions(sport_id, lower, upper)]
+
+    def lookups(self) -> dict:
+        columns = self.columns()
+        return {
+            "_sport_id": columns.sport_names,
+            "_home_team_id": columns.team_names,
+            "_away_team_id": columns.team_names,
+            "_venue_id": columns.venue_names,
+        }
+
+
+event_index = EventIndex()
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+@click.command('event-index-report')
+@click.option('--repeat', default=20, show_default=True, help='Runs per query.')
+def event_index_report_command(repeat: int) -> None:
+    """Report event index memory use and query latency against SQLite."""
+    started = time.perf_counter()
+    columns = event_index.columns()
+    load_ms = (time.perf_counter() - started) * 1000
+    count = len(columns)
+    per_event = columns.memory_usage() / count if count else 0
+    click.echo(f'Loaded {count} events in {load_ms:.1f} ms, {per_event:.0f} bytes per event.')
+    if not count:
+        return
+
+    first, last = from_epoch(columns.date_epochs[0]), from_epoch(columns.date_epochs[-1])
+    middle = from_epoch(columns.date_epochs[count // 2])[:10]
+    queries = [{}, {'date_from': middle}]
+    for sport_id in list(columns.sport_offsets)[:3]:
+        queries.append({'sport_id': sport_id})
+        queries.append({'sport_id': sport_id, 'date_from': first[:10], 'date_to': middle})
+
+    click.echo(f'{"query":<50} {"rows":>7} {"sqlite ms":>10} {"index ms":>10}')
+    for kwargs in queries:
+        rows = len(event_index.get_filtered(**kwargs))
+        # both sides produce the dicts the event view consumes
+        sqlite_ms = _median_ms(lambda: [dict(r) for r in manager.get_filtered(**kwargs)], repeat)
+        index_ms = _median_ms(lambda: event_index.get_filtered(**kwargs), repeat)
+        label = ', '.join(f'{k}={v}' for k, v in kwargs.items()) or 'all'
+        click.echo(f'{label:<50} {rows:>7} {sqlite_ms:>10.3f} {index_ms:>10.3f}')
+    click.echo(f'Events span {first} to {last}.')
@@ -1,10 +1,11 @@
 from datetime import datetime
 from .services import manager
 from ..general.routes import general_add_view, general_get_all_view, general_delete
-from flask import render_template, request, flash
+from flask import abort, current_app, render_template, request, flash
 from ..sport.services import manager as sport_manager
 from ..team.services import manager as team_manager
 from ..venue.services import manager as venue_manager
+from .index import event_index
 
 
 def add_view():
@@ -24,9 +25,15 @@ def add_view():
     )
 
 
-def get_all_view():
-    # Prepare lookup dictionaries for foreign key fields
-    lookups = {
+SCHEDULE_PER_PAGE = 20
+SCHEDULE_MAX_PER_PAGE = 100
+# Largest OFFSET SQLite accepts
+SQLITE_MAX_INTEGER = 2**63 - 1
+
+
+def get_table_lookups() -> dict:
+    # Lookup dictionaries for foreign key fields, read from the small tables only
+    return {
         "_sport_id": {s["sport_id"]: s["name"] for s in sport_manager.get_all()},
         "_home_team_id": {t["team_id"]: t["name"] for t in team_manager.get_all()},
         "_away_team_id": {t["team_id"]: t["name"] for t in team_manager.get_all()},
@@ -35,6 +42,62 @@ def get_all_view():
         },
     }
 
+
+def get_lookups() -> dict:
+    if current_app.config.get("EVENT_INDEX", False):
+        return event_index.lookups()
+    return get_table_lookups()
+
+
+def get_schedule(owner_manager, fetch, id: int, name) -> dict:
+    """
+    One page of fixtures of a team or venue. `fetch` is the manager's schedule
+    query, `name` formats the owner row. Paging comes from the `when`, `page`
+    and `per_page` query arguments; an unknown id aborts with 404.
+    """
+    owner = owner_manager.get(id)
+    if owner is None:
+        abort(404)
+
+    when = "past" if request.args.get("when") == "past" else "upcoming"
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = request.args.get("per_page", SCHEDULE_PER_PAGE, type=int)
+    per_page = min(max(per_page, 1), SCHEDULE_MAX_PER_PAGE)
+
+    offset = (page - 1) * per_page
+    if offset > SQLITE_MAX_INTEGER:
+        # no table holds that many rows, so the page is empty
+        rows = []
+    else:
+        # One extra row tells whether there is a next page
+        rows = fetch(id, upcoming=when == "upcoming", limit=per_page + 1, offset=offset)
+    # Not the event index: a stale index would rebuild the whole event copy
+    lookups = get_table_lookups()
+    events = []
+    for row in rows[:per_page]:
+        event = {key: row[key] for key in row.keys() if key not in manager.hidden_fields}
+        event["sport"] = lookups["_sport_id"].get(event["_sport_id"])
+        event["home_team"] = lookups["_home_team_id"].get(event["_home_team_id"])
+        event["away_team"] = lookups["_away_team_id"].get(event["_away_team_id"])
+        event["venue"] = lookups["_venue_id"].get(event["_venue_id"])
+        events.append(event)
+
+    return {
+        "id": id,
+        "name": name(owner),
+        "when": when,
+        "page": page,
+        "per_page": per_page,
+        "has_next": len(rows) > per_page,
+        "events": events,
+    }
+
+
+def get_all_view():
+    # Serve reads from the in-memory index when enabled
+    use_index = current_app.config.get("EVENT_INDEX", False)
+    lookups = get_lookups()
+
     # Define header labels for better readability
     header_labels = {
         "_sport_id": "sport",
@@ -47,7 +110,8 @@ def get_all_view():
     sport_id = request.args.get('sport_id', type=int)
     date_from = request.args.get('date_from')
     date_to = request.args.get('date_to')
-    rows = manager.get_filtered(sport_id=sport_id, date_from=date_from, date_to=date_to)
+    source = event_index if use_index else manager
+    rows = source.get_filtered(sport_id=sport_id, date_from=date_from, date_to=date_to)
 
     sports = sport_manager.get_all()
 
@@ -1,10 +1,59 @@
-from ..general.services import DatabaseManager
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from sqlite3 import IntegrityError
+from typing import Iterable
+
+from ..general.services import DatabaseManager, ItemServiceError
 from ..db import get_db
 
 
+# Event columns owned by the upstream feed, in the order they are hashed
+FEED_FIELDS = (
+    "event_date",
+    "description",
+    "_sport_id",
+    "_home_team_id",
+    "_away_team_id",
+    "_venue_id",
+)
+SYNC_BATCH_SIZE = 500
+
+
+def content_hash(values: Iterable) -> str:
+    """Stable hash of normalised feed values (see `_feed_values`)."""
+    normalized = "\x1f".join("" if v is None else str(v) for v in values)
+    return hashlib.sha1(normalized.encode("utf8")).hexdigest()
+
+
+@dataclass
+class SyncReport:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    duration: float = 0.0
+
+    @property
+    def touched(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    def __str__(self):
+        return (
+            f"{self.inserted} inserted, {self.updated} updated, "
+            f"{self.deleted} deleted, {self.unchanged} unchanged "
+            f"in {self.duration:.3f}s"
+        )
+
+
 class DatabaseManagerEvent(DatabaseManager):
     def __init__(self):
-        super().__init__("event", nullable_fields=['description'])
+        super().__init__(
+            "event",
+            nullable_fields=['description'],
+            hidden_fields=['content_hash'],
+        )
 
     def get_all_ordered(self) -> list:
         db = get_db()
@@ -32,5 +81,154 @@ class DatabaseManagerEvent(DatabaseManager):
         sql += " ORDER BY event_date DESC"
         return db.execute(sql, params).fetchall()
 
+    def _schedule(self, selects: list[str], params: dict, upcoming: bool, now, limit: int, offset: int) -> list:
+        db = get_db()
+        op, order = (">=", "ASC") if upcoming else ("<", "DESC")
+        params.update(
+            now=now or datetime.now().strftime("%Y-%m-%dT%H:%M"), limit=limit, offset=offset
+        )
+        sql = " UNION ALL ".join(
+            f"SELECT * FROM {self.table_name} WHERE {where} AND event_date {op} :now"
+            for where in selects
+        )
+        sql += f" ORDER BY event_date {order} LIMIT :limit OFFSET :offset"
+        return db.execute(sql, params).fetchall()
+
+    def get_team_schedule(self, team_id, upcoming=True, now=None, limit=20, offset=0) -> list:
+        """
+        Upcoming (soonest first) or past (latest first) fixtures of a team.
+        Home and away games are read from their own indexes and merged by date.
+        """
+        return self._schedule(
+            ["_home_team_id = :team_id", "_away_team_id = :team_id AND _home_team_id != :team_id"],
+            {"team_id": team_id}, upcoming, now, limit, offset,
+        )
+
+    def get_venue_schedule(self, venue_id, upcoming=True, now=None, limit=20, offset=0) -> list:
+        """Upcoming (soonest first) or past (latest first) fixtures at a venue."""
+        return self._schedule(
+            ["_venue_id = :venue_id"], {"venue_id": venue_id}, upcoming, now, limit, offset
+        )
+
+    def _feed_values(self, record: dict) -> tuple:
+        """Validated, normalised feed values; these are both hashed and stored."""
+        external_id = record.get("external_id")
+        values = []
+        for key in FEED_FIELDS:
+            value = record.get(key)
+            if isinstance(value, str):
+                value = value.strip()
+            if value is None or value == "":
+                if key not in self.nullable_fields:
+                    raise ItemServiceError(f'{key} cannot be empty (external_id {external_id}).')
+                value = None
+            elif key == "event_date":
+                value = self._feed_date(value, external_id)
+            elif key.startswith("_"):
+                value = self._feed_id(key, value, external_id)
+            values.append(value)
+        return tuple(values)
+
+    @staticmethod
+    def _feed_date(value, external_id) -> str:
+        # Stored in the add form's format, which the views and the index parse
+        try:
+            dt = datetime.fromisoformat(str(value))
+        except ValueError:
+            raise ItemServiceError(f'Invalid event_date {value!r} (external_id {external_id}).')
+        if dt.tzinfo is not None:
+            raise ItemServiceError(
+                f'event_date {value!r} must not carry a timezone (external_id {external_id}).'
+            )
+        return dt.strftime("%Y-%m-%dT%H:%M")
+
+    @staticmethod
+    def _feed_id(key, value, external_id) -> int:
+        # '01', 1.0 and 1 all reference row 1; SQLite integers are 64-bit
+        try:
+            number = int(value)
+        except (TypeError, ValueError, OverflowError):
+            number = None
+        if number is None or (isinstance(value, float) and number != value) or not -2**63 <= number < 2**63:
+            raise ItemServiceError(f'Invalid {key} {value!r} (external_id {external_id}).')
+        return number
+
+    def sync(self, records: Iterable[dict]) -> SyncReport:
+        """
+        Mirror feed records into the event table, keyed by external_id.
+
+        Stored hashes are loaded in one query and compared while the feed is
+        streamed, so only new, changed and vanished events are written. All
+        writes happen in a single transaction; events without an external_id
+        (added by hand) are never touched.
+        """
+        started = time.perf_counter()
+        db = get_db()
+        report = SyncReport()
+        stored = {
+            row["external_id"]: row["content_hash"]
+            for row in db.execute(
+                f"SELECT external_id, content_hash FROM {self.table_name} "
+                "WHERE external_id IS NOT NULL"
+            )
+        }
+        columns = ", ".join(FEED_FIELDS)
+        insert_sql = (
+            f"INSERT INTO {self.table_name} ({columns}, content_hash, external_id) "
+            f"VALUES ({', '.join(['?'] * (len(FEED_FIELDS) + 2))})"
+        )
+        update_sql = (
+            f"UPDATE {self.table_name} SET "
+            + ", ".join(f"{key} = ?" for key in FEED_FIELDS)
+            + ", content_hash = ? WHERE external_id = ?"
+        )
+        seen = set()
+        inserts, updates = [], []
+
+        try:
+            for record in records:
+                external_id = str(record.get("external_id") or "").strip()
+                if not external_id:
+                    raise ItemServiceError("external_id cannot be empty.")
+                if external_id in seen:
+                    raise ItemServiceError(f"Duplicate external_id {external_id} in feed.")
+                seen.add(external_id)
+
+                values = self._feed_values(record)
+                digest = content_hash(values)
+                if external_id not in stored:
+                    inserts.append((*values, digest, external_id))
+                    report.inserted += 1
+                elif stored[external_id] != digest:
+                    updates.append((*values, digest, external_id))
+                    report.updated += 1
+                else:
+                    report.unchanged += 1
+
+                if len(inserts) >= SYNC_BATCH_SIZE:
+                    db.executemany(insert_sql, inserts)
+                    inserts.clear()
+                if len(updates) >= SYNC_BATCH_SIZE:
+                    db.executemany(update_sql, updates)
+                    updates.clear()
+
+            db.executemany(insert_sql, inserts)
+            db.executemany(update_sql, updates)
+            deletes = [(external_id,) for external_id in stored.keys() - seen]
+            db.executemany(
+                f"DELETE FROM {self.table_name} WHERE external_id = ?", deletes
+            )
+            report.deleted = len(deletes)
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ItemServiceError(f"Feed sync failed: {e}")
+        except Exception:
+            db.rollback()
+            raise
+
+        report.duration = time.perf_counter() - started
+        return report
+
 
 manager = DatabaseManagerEvent()
@@ -0,0 +1,34 @@
+import csv
+import json
+from typing import Iterator
+
+import click
+
+from ..general.services import ItemServiceError
+from .services import manager
+
+
+def read_feed(path: str) -> Iterator[dict]:
+    """Stream records from a feed file: CSV with a header row, otherwise JSON lines."""
+    with open(path, newline="", encoding="utf8") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+            return
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ItemServiceError(f"Invalid JSON on line {line_no}: {e}")
+
+
+@click.command('sync-feed')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def sync_feed_command(path: str) -> None:
+    """Synchronise events with an upstream feed file."""
+    try:
+        report = manager.sync(read_feed(path))
+    except ItemServiceError as e:
+        raise click.ClickException(str(e))
+    click.echo(f'Synced feed: {report} ({report.touched} rows touched).')
@@ -0,0 +1,140 @@
+import unittest
+from unittest import mock
+
+from sportradar_calendar.event.index import EventIndex, from_epoch, to_epoch
+from sportradar_calendar.event.services import DatabaseManagerEvent
+from sportradar_calendar.general.test.helpers import SchemaDatabaseTestCase
+
+
+class TestEventIndex(SchemaDatabaseTestCase):
+
+    # both the SQLite manager and the index read the test database
+    get_db_modules = ('sportradar_calendar.event.services', 'sportradar_calendar.event.index')
+
+    def setUp(self):
+        super().setUp()
+        self.db.executemany('INSERT INTO sport (name) VALUES (?)', [('Football',), ('Hockey',)])
+        self.db.executemany('INSERT INTO team (name) VALUES (?)', [('Team A',), ('Team B',)])
+        self.db.execute("INSERT INTO venue (name, city) VALUES ('Arena', 'Vienna')")
+        self.db.executemany(
+            'INSERT INTO event (event_date, description, _sport_id, _home_team_id, _away_team_id, _venue_id) '
+            'VALUES (?, ?, ?, 1, 2, 1)',
+            [
+                ('2025-11-20T18:00', 'Derby', 1),
+                ('2025-11-01T00:00', None, 2),
+                ('2025-11-30T23:59', None, 1),
+                ('2025-12-01T00:00', None, 1),
+                ('2025-10-31T23:59', None, 2),
+                ('2025-11-15T12:30', None, 2),
+                # dates shared within and across sports
+                ('2025-11-20T18:00', None, 2),
+                ('2025-11-20T18:00', None, 1),
+                ('2025-11-01T00:00', None, 2),
+            ],
+        )
+        self.db.commit()
+        self.manager = DatabaseManagerEvent()
+        self.index = EventIndex()
+
+    def sqlite_rows(self, **kwargs):
+        rows = [dict(r) for r in self.manager.get_filtered(**kwargs)]
+        for row in rows:
+            row.pop('content_hash')
+        return rows
+
+    def test_epoch_round_trip(self):
+        """
+        Test that dates survive conversion to epoch seconds and back.
+        """
+        for value in ['2025-11-20T18:00', '1999-01-01T00:00', '2025-11-20T18:00:30']:
+            with self.subTest(msg=value):
+                self.assertEqual(from_epoch(to_epoch(value)), value)
+
+    def test_get_filtered_matches_sqlite(self):
+        """
+        Test that every filter combination returns the same rows, in the same
+        order (including events sharing a date), as the SQLite path.
+        """
+        for sport_id in [None, 1, 2, 3]:
+            for date_from in [None, '2025-11-01', '2025-11-20T18:00']:
+                for date_to in [None, '2025-11-30', '2025-11-20T18:00']:
+                    kwargs = {'sport_id': sport_id, 'date_from': date_from, 'date_to': date_to}
+                    with self.subTest(**kwargs):
+                        self.assertEqual(self.index.get_filtered(**kwargs), self.sqlite_rows(**kwargs))
+
+    def test_reloads_when_change_counter_moves(self):
+        """
+        Test that writes to the event table are visible on the next query and
+        that the snapshot is reused while nothing changes.
+        """
+        snapshot = self.index.columns()
+        self.assertIs(self.index.columns(), snapshot)
+
+        self.db.execute('DELETE FROM event WHERE _sport_id = 2')
+        self.db.commit()
+
+        self.assertEqual(self.index.get_filtered(sport_id=2), [])
+        self.assertIsNot(self.index.columns(), snapshot)
+
+    def test_lookups_and_unparseable_dates(self):
+        """
+        Test that lookups come from the interned name tables and that inputs
+        the index cannot parse fall back to SQLite.
+        """
+        lookups = self.index.lookups()
+        self.assertEqual(lookups['_sport_id'], {1: 'Football', 2: 'Hockey'})
+        self.assertEqual(lookups['_venue_id'], {1: 'Arena — Vienna'})
+
+        for date_from in ('not-a-date', '2025-01-01T00:00+01:00'):
+            with self.subTest(date_from=date_from):
+                with mock.patch('sportradar_calendar.event.index.manager') as mock_manager:
+                    self.index.get_filtered(date_from=date_from)
+                    mock_manager.get_filtered.assert_called_once_with(sport_id=None, date_from=date_from, date_to=None)
+
+    def test_unparseable_stored_date(self):
+        """
+        Test that a stored row with a bad date is left out of the snapshot,
+        queries fall back to SQLite and lookups keep working.
+        """
+        self.db.execute(
+            "INSERT INTO event (event_date, _sport_id, _home_team_id, _away_team_id, _venue_id) "
+            "VALUES ('garbage', 1, 1, 2, 1)"
+        )
+        self.db.commit()
+
+        self.assertEqual(self.index.columns().skipped, 1)
+        self.assertEqual(
+            [r['event_id'] for r in self.index.get_filtered(sport_id=1)],
+            [r['event_id'] for r in self.sqlite_rows(sport_id=1)],
+        )
+        self.assertEqual(self.index.lookups()['_sport_id'], {1: 'Football', 2: 'Hockey'})
+
+    def test_non_integer_stored_id(self):
+        """
+        Test that a stored row with a non-integer id is left out of the
+        snapshot and queries fall back to SQLite, while ids beyond 32 bits
+        are kept.
+        """
+        self.db.execute(
+            "INSERT INTO event (event_date, _sport_id, _home_team_id, _away_team_id, _venue_id) "
+            "VALUES ('2025-11-20T18:00', 1, 1, 2, 4294967296)"
+        )
+        self.db.commit()
+        self.assertEqual(self.index.columns().skipped, 0)
+        self.assertEqual(self.index.get_filtered(), self.sqlite_rows())
+
+        self.db.execute(
+            "INSERT INTO event (event_date, _sport_id, _home_team_id, _away_team_id, _venue_id) "
+            "VALUES ('2025-11-20T18:00', 'x', 1, 2, 1)"
+        )
+        self.db.commit()
+
+        self.assertEqual(self.index.columns().skipped, 1)
+        self.assertEqual(
+            [r['event_id'] for r in self.index.get_filtered()],
+            [r['event_id'] for r in self.sqlite_rows()],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest import mock
 from flask import Flask
+from werkzeug.exceptions import NotFound
 from datetime import datetime
 
 # We assume tests are executed in a context where sportradar_calendar is a package.
@@ -117,6 +118,98 @@ class TestEventRoutes(unittest.TestCase):
             self.assertIn("_sport_id", kwargs['lookups'])
             self.assertEqual(kwargs['lookups']['_sport_id'], {1: 'Football'})
 
+    @mock.patch("sportradar_calendar.event.routes.general_get_all_view")
+    @mock.patch("sportradar_calendar.event.routes.sport_manager")
+    @mock.patch("sportradar_calendar.event.routes.manager")
+    @mock.patch("sportradar_calendar.event.routes.event_index")
+    def test_get_all_view_with_event_index(self, mock_event_index, mock_manager, mock_sport_manager, mock_general_get_all_view):
+        """
+        Test `get_all_view` with EVENT_INDEX enabled.
+        Rows and lookups should come from the in-memory index instead of SQLite.
+        """
+        # Arrange
+        mock_event_index.get_filtered.return_value = [{"event_id": 1, "event_date": "2025-11-20T18:00"}]
+        mock_event_index.lookups.return_value = {"_sport_id": {1: "Football"}}
+        self.app.config["EVENT_INDEX"] = True
+        self.addCleanup(self.app.config.pop, "EVENT_INDEX")
+
+        with self.app.test_request_context(method="GET", query_string="sport_id=1"):
+            # Act
+            routes.get_all_view()
+
+            # Assert
+            mock_event_index.get_filtered.assert_called_once_with(sport_id=1, date_from=None, date_to=None)
+            mock_manager.get_filtered.assert_not_called()
+
+            _, kwargs = mock_general_get_all_view.call_args
+            self.assertEqual(kwargs['lookups'], {"_sport_id": {1: "Football"}})
+            self.assertEqual(kwargs['items'][0]['event_date_fmt'], "2025-11-20 18:00")
+
+    @mock.patch("sportradar_calendar.event.routes.event_index")
+    @mock.patch("sportradar_calendar.event.routes.get_table_lookups")
+    def test_get_schedule(self, mock_get_table_lookups, mock_event_index):
+        """
+        Test `get_schedule` paging arguments and name resolution.
+        It should fetch one extra row to detect a next page, clamp per_page,
+        drop hidden columns, never go through the event index and return an
+        empty page for offsets beyond SQLite's integer range.
+        """
+        # Arrange
+        mock_get_table_lookups.return_value = {
+            "_sport_id": {1: "Football"},
+            "_home_team_id": {1: "Team A", 2: "Team B"},
+            "_away_team_id": {1: "Team A", 2: "Team B"},
+            "_venue_id": {1: "Venue 1 — City 1"},
+        }
+        owner_manager = mock.MagicMock()
+        owner_manager.get.return_value = {"team_id": 7, "name": "Team A"}
+        row = {"event_id": 1, "event_date": "2025-11-20T18:00", "_sport_id": 1, "_home_team_id": 1, "_away_team_id": 2, "_venue_id": 1, "content_hash": "x"}
+        fetch = mock.MagicMock(return_value=[row, row, row])
+        self.app.config["EVENT_INDEX"] = True
+        self.addCleanup(self.app.config.pop, "EVENT_INDEX")
+
+        with self.app.test_request_context(method="GET", query_string="when=past&page=3&per_page=2"):
+            # Act
+            schedule = routes.get_schedule(owner_manager, fetch, 7, lambda team: team["name"])
+
+        # Assert
+        owner_manager.get.assert_called_once_with(7)
+        fetch.assert_called_once_with(7, upcoming=False, limit=3, offset=4)
+        mock_event_index.lookups.assert_not_called()
+        self.assertEqual((schedule["id"], schedule["name"]), (7, "Team A"))
+        self.assertEqual((schedule["when"], schedule["page"], schedule["per_page"]), ("past", 3, 2))
+        self.assertTrue(schedule["has_next"])
+        self.assertEqual(len(schedule["events"]), 2)
+        self.assertNotIn("content_hash", schedule["events"][0])
+        self.assertEqual(
+            [schedule["events"][0][k] for k in ("sport", "home_team", "away_team", "venue")],
+            ["Football", "Team A", "Team B", "Venue 1 — City 1"],
+        )
+
+        with self.app.test_request_context(method="GET", query_string="when=bogus&page=0&per_page=1000"):
+            schedule = routes.get_schedule(owner_manager, mock.MagicMock(return_value=[]), 7, lambda team: team["name"])
+        self.assertEqual((schedule["when"], schedule["page"], schedule["per_page"]), ("upcoming", 1, routes.SCHEDULE_MAX_PER_PAGE))
+        self.assertFalse(schedule["has_next"])
+
+        fetch = mock.MagicMock(return_value=[])
+        with self.app.test_request_context(method="GET", query_string="page=99999999999999999999"):
+            schedule = routes.get_schedule(owner_manager, fetch, 7, lambda team: team["name"])
+        fetch.assert_not_called()
+        self.assertEqual((schedule["events"], schedule["has_next"]), ([], False))
+
+    def test_get_schedule_unknown_id(self):
+        """
+        Test that `get_schedule` aborts with 404 for an unknown team or venue.
+        """
+        owner_manager = mock.MagicMock()
+        owner_manager.get.return_value = None
+        fetch = mock.MagicMock()
+
+        with self.app.test_request_context(method="GET"):
+            with self.assertRaises(NotFound):
+                routes.get_schedule(owner_manager, fetch, 999, lambda team: team["name"])
+
+        fetch.assert_not_called()
 
     @mock.patch("sportradar_calendar.event.routes.general_delete")
     @mock.patch("sportradar_calendar.event.routes.manager")
@@ -2,6 +2,8 @@ import unittest
 from unittest import mock
 
 from sportradar_calendar.event.services import DatabaseManagerEvent
+from sportradar_calendar.general.services import ItemServiceError
+from sportradar_calendar.general.test.helpers import SchemaDatabaseTestCase
 
 class TestDatabaseManagerEvent(unittest.TestCase):
 
@@ -48,5 +50,139 @@ class TestDatabaseManagerEvent(unittest.TestCase):
                 mock_connection.execute.assert_called_with(expected_sql, expected_params)
                 mock_connection.reset_mock()
 
+    @mock.patch('sportradar_calendar.event.services.get_db')
+    def test_schedule_sql_construction(self, mock_get_db):
+        """
+        Test that team and venue schedules construct the correct SQL and
+        parameters for upcoming and past fixtures.
+        """
+        mock_connection = mock.MagicMock()
+        mock_get_db.return_value = mock_connection
+        now = '2025-11-20T18:00'
+
+        test_cases = [
+            ("Team upcoming", self.manager.get_team_schedule, {'team_id': 3, 'now': now},
+             "SELECT * FROM event WHERE _home_team_id = :team_id AND event_date >= :now UNION ALL SELECT * FROM event WHERE _away_team_id = :team_id AND _home_team_id != :team_id AND event_date >= :now ORDER BY event_date ASC LIMIT :limit OFFSET :offset",
+             {'team_id': 3, 'now': now, 'limit': 20, 'offset': 0}),
+            ("Team past, second page", self.manager.get_team_schedule, {'team_id': 3, 'upcoming': False, 'now': now, 'limit': 10, 'offset': 10},
+             "SELECT * FROM event WHERE _home_team_id = :team_id AND event_date < :now UNION ALL SELECT * FROM event WHERE _away_team_id = :team_id AND _home_team_id != :team_id AND event_date < :now ORDER BY event_date DESC LIMIT :limit OFFSET :offset",
+             {'team_id': 3, 'now': now, 'limit': 10, 'offset': 10}),
+            ("Venue upcoming", self.manager.get_venue_schedule, {'venue_id': 7, 'now': now},
+             "SELECT * FROM event WHERE _venue_id = :venue_id AND event_date >= :now ORDER BY event_date ASC LIMIT :limit OFFSET :offset",
+             {'venue_id': 7, 'now': now, 'limit': 20, 'offset': 0}),
+        ]
+
+        for name, method, kwargs, expected_sql, expected_params in test_cases:
+            with self.subTest(msg=name):
+                method(**kwargs)
+                mock_connection.execute.assert_called_with(expected_sql, expected_params)
+                mock_connection.reset_mock()
+
+
+class TestDatabaseManagerEventSync(SchemaDatabaseTestCase):
+
+    # the diff logic runs against actual rows
+    get_db_modules = ('sportradar_calendar.event.services',)
+
+    def setUp(self):
+        super().setUp()
+        self.manager = DatabaseManagerEvent()
+
+    def record(self, external_id, **overrides):
+        record = {
+            'external_id': external_id,
+            'event_date': '2025-11-20T18:00',
+            'description': '',
+            '_sport_id': 1,
+            '_home_team_id': 1,
+            '_away_team_id': 2,
+            '_venue_id': 1,
+        }
+        record.update(overrides)
+        return record
+
+    def test_sync_inserts_then_leaves_unchanged(self):
+        """
+        Test that a first sync inserts every record and re-running the same
+        feed writes nothing.
+        """
+        feed = [self.record('a'), self.record('b')]
+
+        first = self.manager.sync(feed)
+        second = self.manager.sync(feed)
+
+        self.assertEqual((first.inserted, first.unchanged), (2, 0))
+        self.assertEqual((second.inserted, second.updated, second.deleted, second.unchanged), (0, 0, 0, 2))
+        self.assertEqual(second.touched, 0)
+        self.assertEqual(self.db.execute('SELECT COUNT(*) FROM event').fetchone()[0], 2)
+
+    def test_sync_updates_and_deletes(self):
+        """
+        Test that changed records are updated, missing feed records are deleted
+        and hand-added events are kept.
+        """
+        self.manager.sync([self.record('a'), self.record('b')])
+        self.db.execute(
+            "INSERT INTO event (event_date, _sport_id, _home_team_id, _away_team_id, _venue_id) "
+            "VALUES ('2025-12-01T10:00', 1, 1, 2, 1)"
+        )
+        self.db.commit()
+
+        report = self.manager.sync([self.record('a', event_date='2025-11-21T19:30')])
+
+        self.assertEqual((report.inserted, report.updated, report.deleted, report.unchanged), (0, 1, 1, 0))
+        rows = self.db.execute('SELECT external_id, event_date FROM event ORDER BY event_id').fetchall()
+        self.assertEqual([tuple(r) for r in rows], [('a', '2025-11-21T19:30'), (None, '2025-12-01T10:00')])
+
+    def test_sync_treats_string_and_integer_ids_as_equal(self):
+        """
+        Test that ids from a CSV feed (strings, leading zeros) or JSON floats
+        do not rewrite rows synced from JSON and are stored as integers.
+        """
+        self.manager.sync([self.record('a')])
+
+        report = self.manager.sync([self.record('a', _sport_id='1', _home_team_id='01', _away_team_id=2.0, _venue_id=' 1 ')])
+
+        self.assertEqual(report.unchanged, 1)
+        row = self.db.execute('SELECT typeof(_sport_id), typeof(_home_team_id), typeof(_away_team_id) FROM event').fetchone()
+        self.assertEqual(tuple(row), ('integer', 'integer', 'integer'))
+
+    def test_sync_normalizes_values(self):
+        """
+        Test that dates are stored as YYYY-MM-DDTHH:MM and that whitespace-only
+        changes are stored stripped and do not count as updates.
+        """
+        self.manager.sync([self.record('a', event_date='2025-11-20T18:00:00', description='Derby')])
+
+        report = self.manager.sync([self.record('a', event_date=' 2025-11-20T18:00 ', description='  Derby ')])
+
+        self.assertEqual(report.unchanged, 1)
+        row = self.db.execute('SELECT event_date, description FROM event').fetchone()
+        self.assertEqual(tuple(row), ('2025-11-20T18:00', 'Derby'))
+
+    def test_sync_rolls_back_on_invalid_record(self):
+        """
+        Test that an invalid record aborts the whole sync without partial writes.
+        """
+        self.manager.sync([self.record('a')])
+
+        cases = [
+            ("Missing external_id", [self.record('b'), self.record('')], "external_id cannot be empty"),
+            ("Duplicate external_id", [self.record('b'), self.record('b')], "Duplicate external_id"),
+            ("Missing required field", [self.record('b'), self.record('c', event_date='')], "event_date cannot be empty"),
+            ("Invalid event_date", [self.record('b'), self.record('c', event_date='garbage')], "Invalid event_date"),
+            ("Timezone-aware event_date", [self.record('b'), self.record('c', event_date='2025-11-20T18:00+01:00')], "must not carry a timezone"),
+            ("Non-integer id", [self.record('b'), self.record('c', _sport_id='abc')], "Invalid _sport_id 'abc' (external_id c)"),
+            ("Fractional id", [self.record('b'), self.record('c', _venue_id=1.5)], "Invalid _venue_id 1.5"),
+            ("Id out of range", [self.record('b'), self.record('c', _home_team_id=2**63)], "Invalid _home_team_id"),
+        ]
+        for name, feed, message in cases:
+            with self.subTest(msg=name):
+                with self.assertRaises(ItemServiceError) as ctx:
+                    self.manager.sync(feed)
+                self.assertIn(message, str(ctx.exception))
+                rows = self.db.execute('SELECT external_id FROM event').fetchall()
+                self.assertEqual([r[0] for r in rows], ['a'])
+
 if __name__ == '__main__':
     unittest.main()
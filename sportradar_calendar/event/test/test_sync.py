@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from sportradar_calendar.event.sync import read_feed
+from sportradar_calendar.general.services import ItemServiceError
+
+
+class TestReadFeed(unittest.TestCase):
+
+    def write_feed(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_read_csv_feed(self):
+        """
+        Test that CSV feeds are read as dictionaries keyed by the header row.
+        """
+        path = self.write_feed('.csv', 'external_id,event_date,_sport_id\nm-1,2025-11-20T18:00,1\n')
+
+        records = list(read_feed(path))
+
+        self.assertEqual(records, [{'external_id': 'm-1', 'event_date': '2025-11-20T18:00', '_sport_id': '1'}])
+
+    def test_read_json_lines_feed(self):
+        """
+        Test that JSON lines feeds skip blank lines and report invalid lines.
+        """
+        path = self.write_feed('.jsonl', '{"external_id": "m-1", "_sport_id": 1}\n\n{"external_id": "m-2"}\n')
+        self.assertEqual(
+            list(read_feed(path)),
+            [{'external_id': 'm-1', '_sport_id': 1}, {'external_id': 'm-2'}],
+        )
+
+        path = self.write_feed('.jsonl', '{"external_id": "m-1"}\nnot json\n')
+        with self.assertRaises(ItemServiceError) as ctx:
+            list(read_feed(path))
+        self.assertIn('line 2', str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,9 +10,15 @@ class ItemServiceError(Exception):
 
 
 class DatabaseManager():
-    def __init__(self, table_name: str, nullable_fields: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        table_name: str,
+        nullable_fields: list[str] | None = None,
+        hidden_fields: list[str] | None = None,
+    ) -> None:
         self.table_name = table_name 
         self.nullable_fields = set(nullable_fields) if nullable_fields else set()
+        self.hidden_fields = set(hidden_fields) if hidden_fields else set()
     
     def add(self, **kwargs) -> None:
         processed_kwargs: dict = {}
@@ -48,6 +54,12 @@ class DatabaseManager():
         db.commit()
         
 
+    def get(self, id: int):
+        db = get_db()
+        return db.execute(
+            f'SELECT * FROM {self.table_name} WHERE {self.table_name}_id = ?', (id,)
+        ).fetchone()
+
     def get_all(self) -> list:
         db = get_db()
         cur = db.execute(f'SELECT * FROM {self.table_name}').fetchall()
@@ -56,4 +68,4 @@ class DatabaseManager():
     def get_columns(self) -> list:
         db = get_db()
         columns = db.execute(f'PRAGMA table_info({self.table_name});').fetchall()
-        return columns 
\ No newline at end of file
+        return [c for c in columns if c['name'] not in self.hidden_fields] 
\ No newline at end of file
@@ -0,0 +1,32 @@
+import os
+import sqlite3
+import unittest
+from unittest import mock
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'schema.sql')
+
+
+def create_schema_db(path: str = ':memory:') -> sqlite3.Connection:
+    """Connect to a fresh database built from schema.sql, configured like get_db."""
+    db = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES)
+    db.row_factory = sqlite3.Row
+    with open(SCHEMA_PATH, encoding='utf8') as f:
+        db.executescript(f.read())
+    return db
+
+
+class SchemaDatabaseTestCase(unittest.TestCase):
+    """
+    Runs every test against a fresh in-memory database built from schema.sql,
+    available as `self.db` and returned by `get_db` in `get_db_modules`.
+    """
+
+    get_db_modules = ()
+
+    def setUp(self):
+        self.db = create_schema_db()
+        self.addCleanup(self.db.close)
+        for module in self.get_db_modules:
+            patcher = mock.patch(f'{module}.get_db', return_value=self.db)
+            patcher.start()
+            self.addCleanup(patcher.stop)
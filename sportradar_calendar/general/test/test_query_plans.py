@@ -0,0 +1,264 @@
+import os
+import random
+import re
+import shutil
+import statistics
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from flask import g
+
+from sportradar_calendar import create_app
+from sportradar_calendar.db import get_db
+from sportradar_calendar.event import routes as event_routes
+from sportradar_calendar.event.services import manager as event_manager
+from sportradar_calendar.general.test.helpers import create_schema_db
+from sportradar_calendar.sport import routes as sport_routes
+from sportradar_calendar.team import routes as team_routes
+from sportradar_calendar.venue import routes as venue_routes
+
+# Fixed data scale the time budgets below are calibrated for
+SPORT_COUNT = 8
+TEAM_COUNT = 200
+VENUE_COUNT = 40
+EVENT_COUNT = 20000
+SEASON_START = datetime(2025, 1, 1)
+
+# Every query the application issues must match exactly one entry:
+# (sql pattern, plan line pattern(s) or None for "no plan", time budget in ms).
+# A single pattern must match every plan line, a tuple matches line by line.
+# No plan may ever contain a temporary B-tree sort. Statements are timed inside
+# a savepoint that is rolled back; inserts have no budget because replaying
+# their recorded values would hit UNIQUE constraints.
+EXPECTED_PLANS = [
+    # full listings of the small lookup tables and the plain event table
+    (r"^SELECT \* FROM (sport|team|venue|event)$", r"^SCAN (sport|team|venue|event)$", 300),
+    (r"^SELECT sport_id, name FROM sport$", r"^SCAN sport$", 20),
+    (r"^SELECT team_id, name FROM team$", r"^SCAN team$", 20),
+    (r"^SELECT venue_id, name, city FROM venue$", r"^SCAN venue$", 20),
+    (r"^PRAGMA table_info\(\w+\);$", None, 20),
+    (r"^INSERT INTO \w+ \(", None, None),
+    (r"^DELETE FROM (\w+) WHERE \1_id = \?$", r"^SEARCH \w+ USING INTEGER PRIMARY KEY \(rowid=\?\)$", 20),
+    (r"^SELECT \* FROM (\w+) WHERE \1_id = \?$", r"^SEARCH \w+ USING INTEGER PRIMARY KEY \(rowid=\?\)$", 20),
+    # event list and its filters
+    (r"^SELECT \* FROM event ORDER BY event_date DESC$", r"^SCAN event USING INDEX event_date_idx$", 300),
+    (r"^SELECT \* FROM event WHERE  _sport_id = :sport_id ", r"^SEARCH event USING INDEX event_sport_date_idx \(_sport_id=\?", 100),
+    (r"^SELECT \* FROM event WHERE  event_date [<>]= ", r"^SEARCH event USING INDEX event_date_idx \(event_date[<>]\?", 300),
+    # team and venue schedules
+    (
+        r"^SELECT \* FROM event WHERE _home_team_id = :team_id .* UNION ALL SELECT \* FROM event WHERE _away_team_id = :team_id ",
+        (
+            r"^MERGE \(UNION ALL\)$",
+            r"^LEFT$",
+            r"^SEARCH event USING INDEX event_home_team_date_idx \(_home_team_id=\? AND event_date[<>]\?\)$",
+            r"^RIGHT$",
+            r"^SEARCH event USING INDEX event_away_team_date_idx \(_away_team_id=\? AND event_date[<>]\?\)$",
+        ),
+        20,
+    ),
+    (r"^SELECT \* FROM event WHERE _venue_id = :venue_id ", r"^SEARCH event USING INDEX event_venue_date_idx \(_venue_id=\? AND event_date[<>]\?\)$", 20),
+    # feed sync
+    (r"^SELECT external_id, content_hash FROM event WHERE external_id IS NOT NULL$", r"^SCAN event$", 100),
+    (r"^UPDATE event SET .* WHERE external_id = \?$", r"^SEARCH event USING INDEX sqlite_autoindex_event_\d+ \(external_id=\?\)$", 20),
+    (r"^DELETE FROM event WHERE external_id = \?$", r"^SEARCH event USING INDEX sqlite_autoindex_event_\d+ \(external_id=\?\)$", 20),
+    # in-memory event index
+    (r"^SELECT version FROM change_counter$", r"^SCAN change_counter$", 20),
+    (r"^SELECT event_id, .* FROM event ORDER BY _sport_id, event_date, event_id$", r"^SCAN event USING INDEX event_sport_date_idx$", 300),
+]
+
+
+class RecordingConnection():
+    """Wraps the request's sqlite3 connection and records every statement issued."""
+
+    def __init__(self, connection, statements: dict) -> None:
+        self._connection = connection
+        self._statements = statements
+
+    def execute(self, sql, params=()):
+        self._statements.setdefault(sql, params)
+        return self._connection.execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        if seq_of_params:
+            self._statements.setdefault(sql, seq_of_params[0])
+        return self._connection.executemany(sql, seq_of_params)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class TestQueryPlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build a real database from schema.sql, fill it with a season of
+        representative data through the feed sync and record its queries.
+        Tests run against their own copy of it, see `setUp`.
+        """
+        fd, cls.template_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        create_schema_db(cls.template_path).close()
+        cls.app = create_app()
+        cls.app.config.update(DATABASE=cls.template_path, TESTING=True)
+        cls.sync_statements = {}
+
+        rng = random.Random(42)
+        with cls.app.app_context():
+            db = get_db()
+            db.executemany('INSERT INTO sport (name) VALUES (?)', [(f'Sport {i}',) for i in range(SPORT_COUNT)])
+            db.executemany('INSERT INTO team (name) VALUES (?)', [(f'Team {i}',) for i in range(TEAM_COUNT)])
+            db.executemany(
+                'INSERT INTO venue (name, city) VALUES (?, ?)',
+                [(f'Venue {i}', f'City {i % 10}') for i in range(VENUE_COUNT)],
+            )
+            db.commit()
+
+            feed = []
+            for i in range(EVENT_COUNT):
+                home, away = rng.sample(range(1, TEAM_COUNT + 1), 2)
+                kickoff = SEASON_START + timedelta(days=rng.randrange(365), hours=rng.choice([12, 15, 18, 20]))
+                feed.append({
+                    'external_id': f'match-{i}',
+                    'event_date': kickoff.strftime('%Y-%m-%dT%H:%M'),
+                    'description': rng.choice(['', 'Derby', 'Final']),
+                    '_sport_id': rng.randrange(1, SPORT_COUNT + 1),
+                    '_home_team_id': home,
+                    '_away_team_id': away,
+                    '_venue_id': rng.randrange(1, VENUE_COUNT + 1),
+                })
+            g.db = RecordingConnection(db, cls.sync_statements)
+            event_manager.sync(feed)
+
+            # a second sync exercises the update and delete statements
+            feed[0]['description'] = 'Rescheduled'
+            event_manager.sync(feed[:-1])
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.template_path)
+
+    def setUp(self):
+        # the recorded deletes and inserts are committed by the managers, so
+        # every test gets a fresh copy and never sees another test's writes
+        fd, db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        shutil.copyfile(self.template_path, db_path)
+        self.addCleanup(os.remove, db_path)
+        self.app.config['DATABASE'] = db_path
+        self.statements = {}
+
+    def request(self, *args, **kwargs):
+        """Request context whose connection records into `self.statements`."""
+        context = self.app.test_request_context(*args, **kwargs)
+        context.push()
+        self.addCleanup(context.pop)
+        g.db = RecordingConnection(get_db(), self.statements)
+
+    def expectation(self, sql):
+        matches = [e for e in EXPECTED_PLANS if re.search(e[0], sql)]
+        self.assertEqual(len(matches), 1, f'Expected exactly one plan expectation for: {sql}')
+        return matches[0]
+
+    def check_statements(self, statements: dict):
+        with self.app.app_context():
+            db = get_db()
+            for sql, params in statements.items():
+                _, plan_pattern, budget_ms = self.expectation(sql)
+                plan = [row['detail'] for row in db.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+                with self.subTest(sql=sql, plan=plan):
+                    self.assertFalse([d for d in plan if 'TEMP B-TREE' in d], 'Query sorts with a temp B-tree.')
+                    if plan_pattern is None:
+                        self.assertEqual(plan, [])
+                    elif isinstance(plan_pattern, str):
+                        self.assertTrue(plan and all(re.search(plan_pattern, d) for d in plan))
+                    else:
+                        self.assertEqual(len(plan), len(plan_pattern))
+                        self.assertTrue(all(re.search(p, d) for p, d in zip(plan_pattern, plan)))
+                    if budget_ms is None:
+                        continue
+                    samples = []
+                    for _ in range(3):
+                        db.execute('SAVEPOINT plan_budget')
+                        try:
+                            started = time.perf_counter()
+                            db.execute(sql, params).fetchall()
+                            samples.append((time.perf_counter() - started) * 1000)
+                        finally:
+                            db.execute('ROLLBACK TO plan_budget')
+                            db.execute('RELEASE plan_budget')
+                    self.assertLessEqual(statistics.median(samples), budget_ms)
+
+    def test_sync_queries(self):
+        """
+        Test that the feed sync looks rows up by the external_id index.
+        """
+        recorded = '\n'.join(self.sync_statements)
+        self.assertIn('UPDATE event SET', recorded)
+        self.assertIn('DELETE FROM event WHERE external_id', recorded)
+        self.check_statements(self.sync_statements)
+
+    def test_manager_queries(self):
+        """
+        Test every DatabaseManager query and every get_filtered filter combination.
+        """
+        self.request()
+        for manager in (sport_routes.manager, team_routes.manager, venue_routes.manager, event_manager):
+            manager.get(id=1)
+            manager.get_all()
+            manager.get_columns()
+            manager.delete(id=1)
+        sport_routes.manager.add(name='Curling')
+        event_manager.get_all_ordered()
+        for sport_id in (None, 3):
+            for date_from in (None, '2025-03-01'):
+                for date_to in (None, '2025-03-31', '2025-03-31T18:00'):
+                    event_manager.get_filtered(sport_id=sport_id, date_from=date_from, date_to=date_to)
+        for upcoming in (True, False):
+            event_manager.get_team_schedule(5, upcoming=upcoming, now='2025-07-01T00:00')
+            event_manager.get_venue_schedule(5, upcoming=upcoming, now='2025-07-01T00:00')
+
+        self.check_statements(self.statements)
+
+    def test_route_queries(self):
+        """
+        Test every query issued by the route handlers, with and without the
+        in-memory event index.
+        """
+        for use_index in (False, True):
+            self.app.config['EVENT_INDEX'] = use_index
+            for query_string in ('', 'sport_id=2', 'date_from=2025-06-01&date_to=2025-06-30',
+                                 'sport_id=2&date_from=2025-06-01&date_to=2025-06-30'):
+                self.request('/', query_string=query_string)
+                event_routes.get_all_view()
+        self.app.config['EVENT_INDEX'] = False
+
+        for routes in (team_routes, venue_routes):
+            for query_string in ('', 'when=past&page=2&per_page=10'):
+                self.request('/', query_string=query_string)
+                routes.schedule_view(id=3)
+                routes.schedule_api(id=3)
+
+        self.request('/add')
+        event_routes.add_view()
+        forms = [
+            (sport_routes, {'name': 'Plan check'}),
+            (team_routes, {'name': 'Plan check'}),
+            (venue_routes, {'name': 'Plan check', 'city': 'Plan city'}),
+        ]
+        for routes, form in forms:
+            self.request('/', method='POST', data=form)
+            routes.get_all_view()
+            routes.add_view()
+            routes.delete(id=2)
+        self.request('/delete/2', method='DELETE')
+        event_routes.delete(id=2)
+
+        self.check_statements(self.statements)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,5 +77,19 @@ class TestDatabaseManager(unittest.TestCase):
         mock_db.rollback.assert_called_once()
         mock_db.commit.assert_not_called()
 
+    @mock.patch("sportradar_calendar.general.services.get_db")
+    def test_get_by_id(self, mock_get_db):
+        """
+        Test that `get` looks a single item up by its primary key.
+        """
+        mock_db = mock.MagicMock()
+        mock_get_db.return_value = mock_db
+        mgr = DatabaseManager("team")
+
+        mgr.get(id=3)
+
+        mock_db.execute.assert_called_once_with("SELECT * FROM team WHERE team_id = ?", (3,))
+        mock_db.execute.return_value.fetchone.assert_called_once()
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
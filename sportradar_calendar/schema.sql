@@ -3,6 +3,7 @@ DROP TABLE IF EXISTS sport;
 DROP TABLE IF EXISTS team;
 DROP TABLE IF EXISTS event;
 DROP TABLE IF EXISTS venue;
+DROP TABLE IF EXISTS change_counter;
 
 
 -- create venues table
@@ -33,10 +34,43 @@ CREATE TABLE event (
     _home_team_id INTEGER NOT NULL, -- foreign key referencing first team
     _away_team_id INTEGER NOT NULL, -- foreign key referencing second team
     _venue_id INTEGER NOT NULL,
+    external_id VARCHAR(100) UNIQUE, -- identifier of the event in the upstream feed
+    content_hash CHAR(40), -- hash of the last synced feed record
 
     -- establish foreign key relationships
     FOREIGN KEY (_sport_id) REFERENCES sport(sport_id) ON DELETE CASCADE,
     FOREIGN KEY (_home_team_id) REFERENCES team(team_id) ON DELETE CASCADE,
     FOREIGN KEY (_away_team_id) REFERENCES team(team_id) ON DELETE CASCADE,
     FOREIGN KEY (_venue_id) REFERENCES venue(venue_id) ON DELETE CASCADE
-);
\ No newline at end of file
+);
+
+-- date listing and date range filters, newest first
+CREATE INDEX event_date_idx ON event (event_date);
+-- sport filter, optionally narrowed by date range
+CREATE INDEX event_sport_date_idx ON event (_sport_id, event_date);
+-- team and venue schedules; also serve the foreign key lookups of cascading deletes.
+-- A team's fixtures are read as a UNION ALL of its home and away index ranges.
+CREATE INDEX event_home_team_date_idx ON event (_home_team_id, event_date);
+CREATE INDEX event_away_team_date_idx ON event (_away_team_id, event_date);
+CREATE INDEX event_venue_date_idx ON event (_venue_id, event_date);
+
+-- bumped on every write so in-memory read engines know when to reload;
+-- starts at a random value so a re-initialised database never reuses a
+-- version an engine has already seen
+CREATE TABLE change_counter (
+    version INTEGER NOT NULL
+);
+INSERT INTO change_counter (version) VALUES (abs(random() % 1000000000));
+
+CREATE TRIGGER event_insert_version AFTER INSERT ON event BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER event_update_version AFTER UPDATE ON event BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER event_delete_version AFTER DELETE ON event BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER sport_insert_version AFTER INSERT ON sport BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER sport_update_version AFTER UPDATE ON sport BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER sport_delete_version AFTER DELETE ON sport BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER team_insert_version AFTER INSERT ON team BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER team_update_version AFTER UPDATE ON team BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER team_delete_version AFTER DELETE ON team BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER venue_insert_version AFTER INSERT ON venue BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER venue_update_version AFTER UPDATE ON venue BEGIN UPDATE change_counter SET version = version + 1; END;
+CREATE TRIGGER venue_delete_version AFTER DELETE ON venue BEGIN UPDATE change_counter SET version = version + 1; END;
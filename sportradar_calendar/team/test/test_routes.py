@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+from flask import Flask
+
+from sportradar_calendar.team import routes
+
+
+class TestTeamRoutes(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a Flask app context for the test suite."""
+        cls.app = Flask(__name__)
+        cls.app.secret_key = "dev"
+
+    @mock.patch("sportradar_calendar.event.routes.get_table_lookups")
+    @mock.patch("sportradar_calendar.team.routes.event_manager")
+    @mock.patch("sportradar_calendar.team.routes.manager")
+    def test_schedule_api(self, mock_manager, mock_event_manager, mock_get_table_lookups):
+        """
+        Test `schedule_api` returns the team's fixtures as JSON.
+        """
+        # Arrange
+        mock_manager.get.return_value = {"team_id": 3, "name": "Team A"}
+        mock_event_manager.get_team_schedule.return_value = [
+            {"event_id": 1, "event_date": "2025-11-20T18:00", "description": None, "_sport_id": 1,
+             "_home_team_id": 3, "_away_team_id": 4, "_venue_id": 3, "external_id": None}
+        ]
+        mock_get_table_lookups.return_value = {"_sport_id": {}, "_home_team_id": {}, "_away_team_id": {}, "_venue_id": {}}
+
+        with self.app.test_request_context(method="GET", query_string="when=past"):
+            # Act
+            response = routes.schedule_api(id=3)
+
+        # Assert
+        data = response.get_json()
+        self.assertEqual(set(data), {"id", "name", "when", "page", "per_page", "has_next", "events"})
+        self.assertEqual((data["id"], data["name"], data["when"]), (3, "Team A", "past"))
+        self.assertEqual(data["events"][0]["event_id"], 1)
+        mock_event_manager.get_team_schedule.assert_called_once_with(3, upcoming=False, limit=21, offset=0)
+
+    @mock.patch("sportradar_calendar.team.routes.manager")
+    def test_schedule_unknown_id(self, mock_manager):
+        """
+        Test that the schedule page and API return 404 for an unknown team.
+        """
+        mock_manager.get.return_value = None
+        app = Flask(__name__)
+        app.add_url_rule('/team/<int:id>/schedule', 'team.schedule', routes.schedule_view)
+        app.add_url_rule('/api/team/<int:id>/schedule', 'team.schedule_api', routes.schedule_api)
+        client = app.test_client()
+
+        self.assertEqual(client.get('/team/999/schedule').status_code, 404)
+        self.assertEqual(client.get('/api/team/999/schedule').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+from flask import jsonify, render_template
 from .services import manager
 from ..general.routes import general_add_view, general_get_all_view, general_delete
+from ..event import routes as event_routes
+from ..event.services import manager as event_manager
 
 def add_view():
     return general_add_view(manager=manager, endpoint='venue/form_add_venue.html')
@@ -8,4 +11,15 @@ def get_all_view():
     return general_get_all_view(manager=manager, endpoint='venue/index.html')
 
 def delete(id: int):
-    return general_delete(manager=manager, id=id, endpoint='venue/index.html')
\ No newline at end of file
+    return general_delete(manager=manager, id=id, endpoint='venue/index.html')
+
+def _schedule(id: int) -> dict:
+    return event_routes.get_schedule(
+        manager, event_manager.get_venue_schedule, id, lambda venue: f"{venue['name']} — {venue['city']}"
+    )
+
+def schedule_view(id: int):
+    return render_template('event/schedule.html', title='Venue', endpoint='venue.schedule', **_schedule(id))
+
+def schedule_api(id: int):
+    return jsonify(_schedule(id))